@@ -2,15 +2,12 @@
 
 import argparse
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from importlib.metadata import version
 from typing import Callable
 
-import questionary
 from rich.console import Console
 
 from . import config as cfg
-from .tools import Scope, available_tools, get_tool, ToolConfig
+from .tools import HOOK_COMMAND, Scope, available_tools, get_tool, ToolConfig
 
 console = Console(stderr=True)
 
@@ -35,6 +32,8 @@ def _require_tty(flag: str) -> None:
 
 def _select(message: str, choices: list[str], flag: str) -> str:
     _require_tty(flag)
+    import questionary
+
     selected = questionary.select(message, choices=choices).ask()
     if selected is None:
         raise SystemExit(1)
@@ -43,6 +42,8 @@ def _select(message: str, choices: list[str], flag: str) -> str:
 
 def _confirm(message: str, *, default: bool = False) -> bool:
     _require_tty("--yes")
+    import questionary
+
     result = questionary.confirm(message, default=default).ask()
     if result is None:
         raise SystemExit(1)
@@ -52,6 +53,8 @@ def _confirm(message: str, *, default: bool = False) -> bool:
 def _text(message: str, *, default: str = "", flag: str = "") -> str:
     if flag:
         _require_tty(flag)
+    import questionary
+
     result = questionary.text(message, default=default).ask()
     return result or default
 
@@ -59,6 +62,8 @@ def _text(message: str, *, default: str = "", flag: str = "") -> str:
 def _password(message: str, *, flag: str = "") -> str:
     if flag:
         _require_tty(flag)
+    import questionary
+
     result = questionary.password(message).ask()
     return result or ""
 
@@ -137,6 +142,8 @@ def _run_tool_actions(
                 rc = 1
         return rc
 
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     with ThreadPoolExecutor(max_workers=min(8, len(tools))) as ex:
         futures = {ex.submit(action, tool_name): tool_name for tool_name in tools}
         for fut in as_completed(futures):
@@ -274,7 +281,7 @@ def _detect_runner_prefix() -> str:
 
 def _hook_command_for_provider(provider: str) -> str:
     prefix = _detect_runner_prefix()
-    return f"{prefix}otel-hooks hook --provider {provider}"
+    return f"{prefix}{HOOK_COMMAND} --provider {provider}"
 
 
 def _enable_one(
@@ -388,11 +395,10 @@ def cmd_disable(args: argparse.Namespace) -> int:
     )
 
 
-def _extract_providers_from_settings(tool_cfg: ToolConfig, scope: Scope) -> list[str]:
+def _extract_providers_from_settings(settings: dict) -> list[str]:
     """Extract provider names from registered hook commands in tool settings."""
     import re
 
-    settings = tool_cfg.load_settings(scope)
     providers: list[str] = []
 
     # Collect all command strings from hook settings
@@ -414,7 +420,7 @@ def _extract_providers_from_settings(tool_cfg: ToolConfig, scope: Scope) -> list
                                 commands.append(cmd)
 
     for cmd in commands:
-        if "otel-hooks hook" not in cmd:
+        if HOOK_COMMAND not in cmd:
             continue
         m = re.search(r"--provider\s+(\w+)", cmd)
         if m:
@@ -449,7 +455,7 @@ def cmd_status(args: argparse.Namespace) -> int:
             tool_settings = tool_cfg.load_settings(scope)
             registered = tool_cfg.is_hook_registered(tool_settings)
             path = str(tool_cfg.settings_path(scope))
-            providers = _extract_providers_from_settings(tool_cfg, scope)
+            providers = _extract_providers_from_settings(tool_settings)
             all_providers.update(p for p in providers if p != "(default)")
             status = "[green]registered[/green]" if registered else "[dim]not registered[/dim]"
             provider_label = ", ".join(providers) if providers else "-"
@@ -527,7 +533,8 @@ def _doctor_one(
     registered_providers: list[str] = []
     if include_provider_checks:
         for s in tool_cfg.scopes():
-            registered_providers.extend(_extract_providers_from_settings(tool_cfg, s))
+            settings = tool_settings if s is scope else tool_cfg.load_settings(s)
+            registered_providers.extend(_extract_providers_from_settings(settings))
         # Deduplicate while preserving order
         seen: set[str] = set()
         registered_providers = [p for p in registered_providers if p not in seen and not seen.add(p)]  # type: ignore[func-returns-value]
@@ -587,7 +594,7 @@ def cmd_doctor(args: argparse.Namespace) -> int:
     for tool_name in tools:
         tool_cfg = get_tool(tool_name)
         for scope in tool_cfg.scopes():
-            all_registered.extend(_extract_providers_from_settings(tool_cfg, scope))
+            all_registered.extend(_extract_providers_from_settings(tool_cfg.load_settings(scope)))
     # Deduplicate
     seen_provs: set[str] = set()
     all_registered = [p for p in all_registered if p not in seen_provs and not seen_provs.add(p)]  # type: ignore[func-returns-value]
@@ -625,6 +632,13 @@ def cmd_doctor(args: argparse.Namespace) -> int:
     )
 
 
+def cmd_version(_args: argparse.Namespace) -> int:
+    from importlib.metadata import version
+
+    console.print(version("otel-hooks"))
+    return 0
+
+
 def cmd_hook(_args: argparse.Namespace) -> int:
     from .hook import main as hook_main
     return hook_main()
@@ -637,6 +651,14 @@ def _mask(value: str) -> str:
 
 
 def main() -> None:
+    # AI tools invoke "otel-hooks hook --provider X [--tool Y]" on every event.
+    # hook.main() parses its own flags, so skip building the argparse tree.
+    argv = sys.argv[1:]
+    if argv and argv[0] == "hook" and "-h" not in argv and "--help" not in argv:
+        sys.exit(cmd_hook(argparse.Namespace()))
+    if argv == ["version"]:
+        sys.exit(cmd_version(argparse.Namespace()))
+
     parser = argparse.ArgumentParser(
         prog="otel-hooks",
         description="AI coding tools tracing hooks for observability",
@@ -688,7 +710,7 @@ def main() -> None:
         "status": cmd_status,
         "doctor": cmd_doctor,
         "hook": cmd_hook,
-        "version": lambda _: console.print(version("otel-hooks")) or 0,
+        "version": cmd_version,
     }
     sys.exit(commands[args.command](args))
 
@@ -7,7 +7,6 @@ Config files:
 Merge order: global → project → environment variables (highest priority).
 """
 
-import json
 import logging
 import os
 from pathlib import Path
@@ -15,6 +14,7 @@ from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
+from . import json_codec
 from .file_io import atomic_write
 from .tools import Scope
 
@@ -26,32 +26,33 @@ def config_path(scope: Scope) -> Path:
 
 
 def _read_json(path: Path) -> Dict[str, Any]:
-    if not path.exists():
+    try:
+        return json_codec.loads(path.read_bytes())
+    except FileNotFoundError:
         return {}
-    return json.loads(path.read_text(encoding="utf-8"))
 
 
 # Mapping: config key → (section, field) → env var name
-_ENV_OVERRIDES: list[tuple[str, str]] = [
+_ENV_OVERRIDES: tuple[tuple[str, str], ...] = (
     ("debug", "OTEL_HOOKS_DEBUG"),
     ("max_chars", "OTEL_HOOKS_MAX_CHARS"),
     ("state_dir", "OTEL_HOOKS_STATE_DIR"),
-]
+)
 
-_PROVIDER_ENV: Dict[str, list[tuple[str, str]]] = {
-    "langfuse": [
+_PROVIDER_ENV: Dict[str, tuple[tuple[str, str], ...]] = {
+    "langfuse": (
         ("public_key", "LANGFUSE_PUBLIC_KEY"),
         ("secret_key", "LANGFUSE_SECRET_KEY"),
         ("base_url", "LANGFUSE_BASE_URL"),
-    ],
-    "otlp": [
+    ),
+    "otlp": (
         ("endpoint", "OTEL_EXPORTER_OTLP_ENDPOINT"),
         ("headers", "OTEL_EXPORTER_OTLP_HEADERS"),
-    ],
-    "datadog": [
+    ),
+    "datadog": (
         ("service", "DD_SERVICE"),
         ("env", "DD_ENV"),
-    ],
+    ),
 }
 
 
@@ -96,21 +97,16 @@ def _apply_env_overrides(merged: Dict[str, Any]) -> None:
 
     # Apply provider-specific env overrides for all configured providers
     for provider, fields in _PROVIDER_ENV.items():
-        if provider not in merged:
-            # Only apply if env vars are actually set
-            has_env = any(os.environ.get(env_var) for _, env_var in fields)
-            if not has_env:
-                continue
-        section = merged.setdefault(provider, {})
-        for field, env_var in fields:
-            val = os.environ.get(env_var)
-            if val:
-                section[field] = val
+        # Look each variable up once; only create a section if any is set.
+        overrides = [(field, val) for field, env_var in fields if (val := os.environ.get(env_var))]
+        if not overrides:
+            continue
+        merged.setdefault(provider, {}).update(overrides)
 
 
 def save_config(data: Dict[str, Any], scope: Scope) -> None:
     """Save config to the specified scope."""
-    atomic_write(config_path(scope), (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
+    atomic_write(config_path(scope), json_codec.dumps_pretty(data))
 
 
 def get_provider_config(config: Dict[str, Any], provider: str) -> Dict[str, str]:
@@ -118,6 +114,6 @@ def get_provider_config(config: Dict[str, Any], provider: str) -> Dict[str, str]
     return config.get(provider, {})
 
 
-def env_keys_for_provider(provider: str) -> list[tuple[str, str]]:
+def env_keys_for_provider(provider: str) -> tuple[tuple[str, str], ...]:
     """Return (config_field, env_var_name) pairs for a provider."""
-    return _PROVIDER_ENV.get(provider, [])
+    return _PROVIDER_ENV.get(provider, ())
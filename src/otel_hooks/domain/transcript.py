@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 from dataclasses import dataclass
 from typing import Any
 
+from otel_hooks import json_codec
+
 logger = logging.getLogger(__name__)
 
 MAX_CHARS_DEFAULT = 20000
@@ -50,48 +51,104 @@ def is_tool_result(msg: dict[str, Any]) -> bool:
 
 
 def iter_tool_results(content: Any) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
-    if isinstance(content, list):
-        for x in content:
-            if isinstance(x, dict) and x.get("type") == "tool_result":
-                out.append(x)
-    return out
+    if not isinstance(content, list):
+        return []
+    return [x for x in content if isinstance(x, dict) and x.get("type") == "tool_result"]
 
 
 def iter_tool_uses(content: Any) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
-    if isinstance(content, list):
-        for x in content:
-            if isinstance(x, dict) and x.get("type") == "tool_use":
-                out.append(x)
-    return out
+    if not isinstance(content, list):
+        return []
+    return [x for x in content if isinstance(x, dict) and x.get("type") == "tool_use"]
+
+
+# A tuple, not a set: "type"/"role" come from arbitrary JSONL and may be unhashable.
+_ROLES = ("user", "assistant")
+
+
+def _classify(msg: Any) -> tuple[str | None, Any, bool]:
+    """Return ``(role, content, is_tool_result)`` with a single pass over *msg*.
+
+    Equivalent to calling get_role / get_content / is_tool_result separately.
+    """
+    if not isinstance(msg, dict):
+        return None, None, False
+    m = msg.get("message")
+    has_message = isinstance(m, dict)
+    role = msg.get("type")
+    if role not in _ROLES:
+        role = m.get("role") if has_message else None
+        if role not in _ROLES:
+            role = None
+    content = m.get("content") if has_message else msg.get("content")
+    if role != "user" or not isinstance(content, list):
+        return role, content, False
+    for x in content:
+        if isinstance(x, dict) and x.get("type") == "tool_result":
+            return role, content, True
+    return role, content, False
 
 
 def extract_text(content: Any) -> str:
     if isinstance(content, str):
         return content
-    if isinstance(content, list):
-        parts: list[str] = []
-        for x in content:
-            if isinstance(x, dict) and x.get("type") == "text":
-                parts.append(x.get("text", ""))
-            elif isinstance(x, str):
+    if not isinstance(content, list):
+        return ""
+    parts: list[str] = []
+    for x in content:
+        if isinstance(x, str):
+            if x:
                 parts.append(x)
-        return "\n".join([p for p in parts if p])
-    return ""
+        elif isinstance(x, dict) and x.get("type") == "text":
+            text = x.get("text")
+            if text:
+                parts.append(text)
+    return "\n".join(parts)
+
+
+def _omission_marker(omitted: int) -> str:
+    return f"…[{omitted} chars omitted]…"
+
 
+def truncate_text(
+    s: str,
+    max_chars: int = MAX_CHARS_DEFAULT,
+    *,
+    mode: str = "head",
+) -> tuple[str, dict[str, Any]]:
+    """Cap *s* at *max_chars* characters.
 
-def truncate_text(s: str, max_chars: int = MAX_CHARS_DEFAULT) -> tuple[str, dict[str, Any]]:
+    ``mode="head"`` keeps the first *max_chars* characters. ``mode="middle"``
+    keeps the start and the end around an omission marker; the marker is
+    counted against the budget, so the result is still *max_chars* long.
+    """
     if s is None:
         return "", {"truncated": False, "orig_len": 0}
     orig_len = len(s)
     if orig_len <= max_chars:
         return s, {"truncated": False, "orig_len": orig_len}
-    head = s[:max_chars]
-    return head, {
+    text = s[:max_chars]
+    kept_len = max_chars
+    if mode == "middle":
+        marker = _omission_marker(orig_len - max_chars)
+        # The marker's width depends on the omitted count; settle it first.
+        while True:
+            kept_len = max_chars - len(marker)
+            resized = _omission_marker(orig_len - kept_len)
+            settled = len(resized) == len(marker)
+            marker = resized
+            if settled:
+                break
+        if kept_len > 0:
+            tail_len = kept_len // 2
+            head_len = kept_len - tail_len
+            text = s[:head_len] + marker + (s[-tail_len:] if tail_len else "")
+        else:
+            kept_len = max_chars
+    return text, {
         "truncated": True,
         "orig_len": orig_len,
-        "kept_len": len(head),
+        "kept_len": kept_len,
         "sha256": hashlib.sha256(s.encode("utf-8")).hexdigest(),
     }
 
@@ -116,27 +173,26 @@ def get_message_id(msg: dict[str, Any]) -> str | None:
 def build_turns(messages: list[dict[str, Any]]) -> list[Turn]:
     turns: list[Turn] = []
     current_user: dict[str, Any] | None = None
-    assistant_order: list[str] = []
-    assistant_latest: dict[str, dict[str, Any]] = {}
+    # Keyed by message id; dicts keep first-insertion order, so a re-sent
+    # (streamed) assistant message replaces its value in place.
+    assistants: dict[str, dict[str, Any]] = {}
     tool_results_by_id: dict[str, Any] = {}
 
     def flush_turn() -> None:
-        nonlocal current_user, assistant_order, assistant_latest, tool_results_by_id
-        if current_user is None or not assistant_latest:
+        if current_user is None or not assistants:
             return
-        assistants = [assistant_latest[mid] for mid in assistant_order if mid in assistant_latest]
         turns.append(
             Turn(
                 user_msg=current_user,
-                assistant_msgs=assistants,
+                assistant_msgs=list(assistants.values()),
                 tool_results_by_id=dict(tool_results_by_id),
             )
         )
 
     for msg in messages:
-        role = get_role(msg)
-        if is_tool_result(msg):
-            for tr in iter_tool_results(get_content(msg)):
+        role, content, is_tr = _classify(msg)
+        if is_tr:
+            for tr in iter_tool_results(content):
                 tid = tr.get("tool_use_id")
                 if tid:
                     tool_results_by_id[str(tid)] = tr.get("content")
@@ -144,17 +200,14 @@ def build_turns(messages: list[dict[str, Any]]) -> list[Turn]:
         if role == "user":
             flush_turn()
             current_user = msg
-            assistant_order = []
-            assistant_latest = {}
+            assistants = {}
             tool_results_by_id = {}
             continue
         if role == "assistant":
             if current_user is None:
                 continue
-            mid = get_message_id(msg) or f"noid:{len(assistant_order)}"
-            if mid not in assistant_latest:
-                assistant_order.append(mid)
-            assistant_latest[mid] = msg
+            mid = get_message_id(msg) or f"noid:{len(assistants)}"
+            assistants[mid] = msg
 
     flush_turn()
     return turns
@@ -167,7 +220,7 @@ def decode_jsonl_lines(lines: list[str]) -> list[dict[str, Any]]:
         if not line:
             continue
         try:
-            msgs.append(json.loads(line))
+            msgs.append(json_codec.loads(line))
         except Exception:
             logger.debug("Skipping malformed JSONL line: %.100s", line)
             continue
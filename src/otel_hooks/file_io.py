@@ -12,9 +12,13 @@ def atomic_write(path: Path, data: bytes, mode: int = 0o600) -> None:
     Creates a temporary file with the given permissions, writes data,
     then atomically replaces the target path.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".tmp")
-    fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(str(tmp), flags, mode)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(tmp), flags, mode)
     try:
         os.write(fd, data)
     finally:
@@ -6,7 +6,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
 import time
@@ -17,6 +16,7 @@ from urllib.parse import urlparse
 logger = logging.getLogger(__name__)
 
 from openhook import EventType, OpenHookEvent
+from otel_hooks import json_codec
 from otel_hooks.tools import parse_hook_event
 from otel_hooks.domain.transcript import build_turns, decode_jsonl_lines
 from otel_hooks.providers.factory import create_provider
@@ -26,9 +26,7 @@ from otel_hooks.runtime.state import (
     StatePaths,
     build_state_paths,
     load_session_state,
-    load_state,
     read_new_jsonl_lines,
-    save_state,
     state_key,
     write_session_state,
 )
@@ -134,10 +132,11 @@ def _resolve_state_paths(config: dict[str, Any]) -> StatePaths:
 def read_hook_payload() -> dict[str, Any]:
     """Read JSON payload from stdin (provided by parent AI tool process)."""
     try:
-        data = sys.stdin.read()
+        # Read raw bytes so the payload is decoded once, by the JSON parser.
+        data = getattr(sys.stdin, "buffer", sys.stdin).read()
         payload: dict[str, Any] = {}
         if data.strip():
-            payload = json.loads(data)
+            payload = json_codec.loads(data)
         return payload
     except Exception:
         logger.warning("Failed to read hook payload from stdin", exc_info=True)
@@ -181,18 +180,19 @@ def run_hook(
             )
             return 0
 
-    provider = provider_factory(provider_name, config)
-    if not provider:
-        logger.warning("Failed to create provider: %s", provider_name)
-        return 1
-
+    provider = None
     emitted = 0
     attributed_turns: list = []
     try:
         if _is_metric_event(event):
+            metric_name = _derive_metric_name(event)
+            provider = provider_factory(provider_name, config)
+            if not provider:
+                logger.warning("Failed to create provider: %s", provider_name)
+                return 1
             try:
                 provider.emit_metric(
-                    _derive_metric_name(event),
+                    metric_name,
                     _derive_metric_value(event),
                     _derive_metric_attrs(event),
                     event.source,
@@ -210,32 +210,49 @@ def run_hook(
             duration = time.time() - start
             logger.info(
                 "Processed metric %s in %.2fs (session=%s, provider=%s)",
-                _derive_metric_name(event),
+                metric_name,
                 duration,
                 event.session_id or "-",
                 provider_name,
             )
             return 0
 
+        key = state_key(event.session_id, str(event.transcript_path))
+        # Idle hook fires are the common case: if the transcript has not moved
+        # past the saved offset, exit without bootstrapping a provider SDK.
+        saved_offset = load_session_state(runtime_state_paths, key).offset
+        try:
+            if event.transcript_path.stat().st_size == saved_offset:
+                logger.debug("No new transcript data; exiting.")
+                return 0
+        except OSError:
+            pass
+
+        # Create the provider before taking the lock shared by every session;
+        # SDK import and bootstrap must not count against lock hold time.
+        provider = provider_factory(provider_name, config)
+        if not provider:
+            logger.warning("Failed to create provider: %s", provider_name)
+            return 1
+
         with FileLock(runtime_state_paths.lock_file):
-            state = load_state(runtime_state_paths.state_file)
-            key = state_key(event.session_id, str(event.transcript_path))
-            ss = load_session_state(state, key)
+            ss = load_session_state(runtime_state_paths, key)
             prev_offset = ss.offset
             prev_buffer = ss.buffer
             prev_turn_count = ss.turn_count
 
             lines, ss = read_new_jsonl_lines(event.transcript_path, ss)
             if not lines:
-                write_session_state(state, key, ss)
-                save_state(state, runtime_state_paths.state_file)
+                # Only persist when the read actually moved the cursor
+                # (e.g. a partial trailing line).
+                if ss.offset != prev_offset or ss.buffer != prev_buffer:
+                    write_session_state(runtime_state_paths, key, ss)
                 return 0
 
             msgs = decode_jsonl_lines(lines)
             turns = build_turns(msgs)
             if not turns:
-                write_session_state(state, key, ss)
-                save_state(state, runtime_state_paths.state_file)
+                write_session_state(runtime_state_paths, key, ss)
                 return 0
 
             emit_failed = False
@@ -262,8 +279,7 @@ def run_hook(
                 ss.turn_count = prev_turn_count
             else:
                 ss.turn_count += emitted
-            write_session_state(state, key, ss)
-            save_state(state, runtime_state_paths.state_file)
+            write_session_state(runtime_state_paths, key, ss)
 
         try:
             provider.flush()
@@ -295,10 +311,11 @@ def run_hook(
         logger.warning("Unexpected failure", exc_info=True)
         return 1
     finally:
-        try:
-            provider.shutdown()
-        except Exception:
-            logger.warning("provider.shutdown() failed", exc_info=True)
+        if provider is not None:
+            try:
+                provider.shutdown()
+            except Exception:
+                logger.warning("provider.shutdown() failed", exc_info=True)
 
 
 def _parse_flag(name: str) -> str | None:
@@ -0,0 +1,38 @@
+"""JSON encoding/decoding with optional orjson acceleration.
+
+``orjson`` is used when installed (``pip install otel-hooks[fast]``);
+otherwise this falls back to the standard library ``json`` module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document from bytes or str."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (NaN, >64-bit ints); defer to
+            # the stdlib so both backends accept the same documents.
+            pass
+    return json.loads(data)
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Encode *obj* as 2-space indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # Non-str keys, >64-bit ints, etc.: let the stdlib handle them.
+            pass
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
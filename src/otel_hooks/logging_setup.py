@@ -10,6 +10,7 @@ from pathlib import Path
 _PACKAGE = "otel_hooks"
 _LOG_BYTES = 1 * 1024 * 1024  # 1 MiB per file
 _LOG_BACKUPS = 3  # keep .log, .log.1, .log.2, .log.3
+_LOG_BUFFER_RECORDS = 256
 
 
 def configure(log_file: Path, *, debug: bool = False, reconfigure: bool = False) -> None:
@@ -21,11 +22,18 @@ def configure(log_file: Path, *, debug: bool = False, reconfigure: bool = False)
     if pkg_logger.handlers and not reconfigure:
         return
     if reconfigure:
-        pkg_logger.handlers.clear()
+        for h in pkg_logger.handlers[:]:
+            pkg_logger.removeHandler(h)
+            target = getattr(h, "target", None)
+            h.close()  # MemoryHandler.close() flushes the buffer first
+            if target is not None:
+                target.close()
 
     pkg_logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
-    # File handler — all levels, with rotation
+    # File handler — all levels, with rotation. Records are buffered and
+    # written together (on WARNING, when full, or at exit) so a hook fire
+    # costs one write rather than one per log line.
     try:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         fh = logging.handlers.RotatingFileHandler(
@@ -41,7 +49,12 @@ def configure(log_file: Path, *, debug: bool = False, reconfigure: bool = False)
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
-        pkg_logger.addHandler(fh)
+        mh = logging.handlers.MemoryHandler(
+            _LOG_BUFFER_RECORDS,
+            flushLevel=logging.WARNING,
+            target=fh,
+        )
+        pkg_logger.addHandler(mh)
     except OSError as exc:
         print(
             f"otel-hooks: WARNING: could not open log file {log_file}: {exc}",
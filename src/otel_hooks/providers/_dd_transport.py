@@ -75,12 +75,23 @@ class Tracer:
     def set_tags(self, tags: dict[str, str]) -> None:
         self._global_tags.update(tags)
 
-    @contextmanager
-    def trace(self, name: str, resource: str, service: str, span_type: str):
-        parent = _current_span.get(None)
-        trace_id = parent.trace_id if parent else _rand64()
-        span = Span(
-            trace_id=trace_id,
+    def start_span(
+        self,
+        name: str,
+        resource: str,
+        service: str,
+        span_type: str,
+        tags: dict[str, str] | None = None,
+        child_of: Span | None = None,
+    ) -> Span:
+        """Create a span without activating or buffering it.
+
+        The parent is *child_of* when given, else the active span. Pass the
+        span to :meth:`finish_spans` to record it.
+        """
+        parent = child_of if child_of is not None else _current_span.get(None)
+        return Span(
+            trace_id=parent.trace_id if parent else _rand64(),
             span_id=_rand64(),
             parent_id=parent.span_id if parent else 0,
             name=name,
@@ -88,8 +99,27 @@ class Tracer:
             service=service,
             type=span_type,
             start=_now_ns(),
-            meta=dict(self._global_tags),
+            meta={**self._global_tags, **tags} if tags else dict(self._global_tags),
         )
+
+    def finish_spans(self, spans: list[Span]) -> None:
+        """Finish spans from :meth:`start_span` and buffer them under one lock."""
+        now = _now_ns()
+        for span in spans:
+            span.duration = now - span.start
+        with self._lock:
+            self._buffer.extend(spans)
+
+    @contextmanager
+    def trace(
+        self,
+        name: str,
+        resource: str,
+        service: str,
+        span_type: str,
+        tags: dict[str, str] | None = None,
+    ):
+        span = self.start_span(name, resource, service, span_type, tags)
         with self._lock:
             self._buffer.append(span)
         token = _current_span.set(span)
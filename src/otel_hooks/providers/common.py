@@ -29,19 +29,43 @@ class TurnPayload:
     tool_calls: list[ToolCall]
 
 
-def _tool_calls_from_assistants(assistant_msgs: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    calls: list[dict[str, Any]] = []
+def _tool_calls_from_assistants(
+    assistant_msgs: list[dict[str, Any]],
+    tool_results_by_id: dict[str, Any],
+    max_chars: int,
+) -> list[ToolCall]:
+    """Collect tool calls and attach their results in a single pass.
+
+    Tool payloads are middle-truncated: the command or path at the start and
+    the final result/exit status at the end are what make them debuggable.
+    """
+    calls: list[ToolCall] = []
     for am in assistant_msgs:
         for tu in iter_tool_uses(get_content(am)):
-            tid = tu.get("id") or ""
+            tid = str(tu.get("id") or "")
+            input_obj = tu.get("input")
+            input_meta: dict[str, Any] | None = None
+            if isinstance(input_obj, str):
+                input_obj, input_meta = truncate_text(input_obj, max_chars, mode="middle")
+            elif not isinstance(input_obj, (dict, list, int, float, bool)):
+                input_obj = {}
+
+            output: str | None = None
+            output_meta: dict[str, Any] | None = None
+            if tid and tid in tool_results_by_id:
+                out_raw = tool_results_by_id[tid]
+                out_str = out_raw if isinstance(out_raw, str) else json.dumps(out_raw, ensure_ascii=False)
+                output, output_meta = truncate_text(out_str, max_chars, mode="middle")
+
             calls.append(
-                {
-                    "id": str(tid),
-                    "name": tu.get("name") or "unknown",
-                    "input": tu.get("input")
-                    if isinstance(tu.get("input"), (dict, list, str, int, float, bool))
-                    else {},
-                }
+                ToolCall(
+                    id=tid,
+                    name=tu.get("name") or "unknown",
+                    input=input_obj,
+                    output=output,
+                    input_meta=input_meta,
+                    output_meta=output_meta,
+                )
             )
     return calls
 
@@ -55,32 +79,7 @@ def build_turn_payload(turn: Turn, *, max_chars: int = MAX_CHARS_DEFAULT) -> Tur
     assistant_text, assistant_text_meta = truncate_text(assistant_text_raw, max_chars)
 
     model = get_model(turn.assistant_msgs[0])
-    raw_tool_calls = _tool_calls_from_assistants(turn.assistant_msgs)
-
-    tool_calls: list[ToolCall] = []
-    for c in raw_tool_calls:
-        input_obj = c["input"]
-        input_meta: dict[str, Any] | None = None
-        if isinstance(input_obj, str):
-            input_obj, input_meta = truncate_text(input_obj, max_chars)
-
-        output: str | None = None
-        output_meta: dict[str, Any] | None = None
-        if c["id"] and c["id"] in turn.tool_results_by_id:
-            out_raw = turn.tool_results_by_id[c["id"]]
-            out_str = out_raw if isinstance(out_raw, str) else json.dumps(out_raw, ensure_ascii=False)
-            output, output_meta = truncate_text(out_str, max_chars)
-
-        tool_calls.append(
-            ToolCall(
-                id=c["id"],
-                name=c["name"],
-                input=input_obj,
-                output=output,
-                input_meta=input_meta,
-                output_meta=output_meta,
-            )
-        )
+    tool_calls = _tool_calls_from_assistants(turn.assistant_msgs, turn.tool_results_by_id, max_chars)
 
     return TurnPayload(
         user_text=user_text,
@@ -28,45 +28,48 @@ class DatadogProvider:
             tags["transcript_path"] = str(transcript_path)
         if source_tool:
             tags["source_tool"] = source_tool
+        # Leaf spans are created against the root and buffered in one batch
+        # instead of entering and leaving a context per span.
         with self._tracer.trace(
             "ai_session.turn",
             resource=f"{source_tool} - Turn {turn_num}" if source_tool else f"Turn {turn_num}",
             service="otel-hooks",
             span_type="llm",
+            tags=tags,
         ) as root_span:
-            root_span.set_tags(tags)
-
-            with self._tracer.trace(
-                "ai_session.generation",
-                resource="Assistant Response",
-                service="otel-hooks",
-                span_type="llm",
-            ) as gen_span:
-                gen_span.set_tags(
-                    {
+            leaves = [
+                self._tracer.start_span(
+                    "ai_session.generation",
+                    resource="Assistant Response",
+                    service="otel-hooks",
+                    span_type="llm",
+                    tags={
                         "gen_ai.request.model": payload.model,
                         "gen_ai.prompt": payload.user_text,
                         "gen_ai.completion": payload.assistant_text,
                         "gen_ai.usage.tool_count": str(len(payload.tool_calls)),
-                    }
+                    },
+                    child_of=root_span,
                 )
-
+            ]
             for tc in payload.tool_calls:
                 in_str = tc.input if isinstance(tc.input, str) else json.dumps(tc.input, ensure_ascii=False)
-                with self._tracer.trace(
-                    "ai_session.tool",
-                    resource=tc.name,
-                    service="otel-hooks",
-                    span_type="tool",
-                ) as tool_span:
-                    tool_span.set_tags(
-                        {
+                leaves.append(
+                    self._tracer.start_span(
+                        "ai_session.tool",
+                        resource=tc.name,
+                        service="otel-hooks",
+                        span_type="tool",
+                        tags={
                             "tool.name": tc.name,
                             "tool.id": tc.id,
                             "tool.input": in_str,
                             "tool.output": tc.output or "",
-                        }
+                        },
+                        child_of=root_span,
                     )
+                )
+            self._tracer.finish_spans(leaves)
 
     def emit_metric(
         self,
@@ -76,25 +79,26 @@ class DatadogProvider:
         source_tool: str = "",
         session_id: str = "",
     ) -> None:
+        tags: dict[str, str] = {
+            "metric.name": metric_name,
+            "metric.value": str(metric_value),
+            "gen_ai.system": "otel-hooks",
+        }
+        if source_tool:
+            tags["source_tool"] = source_tool
+        if session_id:
+            tags["session.id"] = session_id
+        if attributes:
+            for k, v in attributes.items():
+                tags[f"metric.attr.{k}"] = v
         with self._tracer.trace(
             "ai_session.metric",
             resource=metric_name,
             service="otel-hooks",
             span_type="custom",
-        ) as metric_span:
-            tags: dict[str, str] = {
-                "metric.name": metric_name,
-                "metric.value": str(metric_value),
-                "gen_ai.system": "otel-hooks",
-            }
-            if source_tool:
-                tags["source_tool"] = source_tool
-            if session_id:
-                tags["session.id"] = session_id
-            if attributes:
-                for k, v in attributes.items():
-                    tags[f"metric.attr.{k}"] = v
-            metric_span.set_tags(tags)
+            tags=tags,
+        ):
+            pass
 
     def emit_attribution(
         self,
@@ -102,45 +106,49 @@ class DatadogProvider:
         file_records: list,
         source_tool: str = "",
     ) -> None:
+        root_tags: dict[str, str] = {
+            "session.id": session_id,
+            "gen_ai.system": "otel-hooks",
+            "attribution.file_count": str(len(file_records)),
+        }
+        if source_tool:
+            root_tags["source_tool"] = source_tool
         with self._tracer.trace(
             "ai_session.attribution",
             resource=f"{source_tool} - Attribution" if source_tool else "Attribution",
             service="otel-hooks",
             span_type="custom",
+            tags=root_tags,
         ) as root_span:
-            root_tags: dict[str, str] = {
-                "session.id": session_id,
-                "gen_ai.system": "otel-hooks",
-                "attribution.file_count": str(len(file_records)),
-            }
-            if source_tool:
-                root_tags["source_tool"] = source_tool
-            root_span.set_tags(root_tags)
-
+            file_spans = []
             for f in file_records:
                 conv = f.conversations[0] if f.conversations else None
-                with self._tracer.trace(
-                    "ai_session.file_attribution",
-                    resource=f.path,
-                    service="otel-hooks",
-                    span_type="custom",
-                ) as file_span:
-                    tags: dict[str, str] = {
-                        "session.id": session_id,
-                        "file.path": f.path,
-                        "attribution.contributor": conv.contributor.type if conv else "unknown",
-                    }
-                    if source_tool:
-                        tags["source_tool"] = source_tool
-                    if conv and conv.contributor.model:
-                        tags["ai.model"] = conv.contributor.model
-                    if conv and conv.ranges:
-                        tags["file.lines.start"] = str(conv.ranges[0].start_line)
-                        tags["file.lines.end"] = str(conv.ranges[-1].end_line)
-                        tags["file.lines.count"] = str(
-                            sum(r.end_line - r.start_line + 1 for r in conv.ranges)
-                        )
-                    file_span.set_tags(tags)
+                tags: dict[str, str] = {
+                    "session.id": session_id,
+                    "file.path": f.path,
+                    "attribution.contributor": conv.contributor.type if conv else "unknown",
+                }
+                if source_tool:
+                    tags["source_tool"] = source_tool
+                if conv and conv.contributor.model:
+                    tags["ai.model"] = conv.contributor.model
+                if conv and conv.ranges:
+                    tags["file.lines.start"] = str(conv.ranges[0].start_line)
+                    tags["file.lines.end"] = str(conv.ranges[-1].end_line)
+                    tags["file.lines.count"] = str(
+                        sum(r.end_line - r.start_line + 1 for r in conv.ranges)
+                    )
+                file_spans.append(
+                    self._tracer.start_span(
+                        "ai_session.file_attribution",
+                        resource=f.path,
+                        service="otel-hooks",
+                        span_type="custom",
+                        tags=tags,
+                        child_of=root_span,
+                    )
+                )
+            self._tracer.finish_spans(file_spans)
 
     def flush(self) -> None:
         self._tracer.flush()
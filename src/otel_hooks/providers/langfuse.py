@@ -32,6 +32,8 @@ class LangfuseProvider:
         tags = ["otel-hooks"]
         if source_tool:
             tags.append(source_tool)
+        user_input = {"role": "user", "content": payload.user_text}
+        assistant_output = {"role": "assistant", "content": payload.assistant_text}
         with propagate_attributes(
             session_id=session_id,
             trace_name=span_name,
@@ -39,15 +41,15 @@ class LangfuseProvider:
         ):
             with self._langfuse.start_as_current_span(
                 name=span_name,
-                input={"role": "user", "content": payload.user_text},
+                input=user_input,
                 metadata=metadata,
             ) as trace_span:
                 with self._langfuse.start_as_current_observation(
                     name="Assistant Response",
                     as_type="generation",
                     model=payload.model,
-                    input={"role": "user", "content": payload.user_text},
-                    output={"role": "assistant", "content": payload.assistant_text},
+                    input=user_input,
+                    output=assistant_output,
                     metadata={
                         "assistant_text": payload.assistant_text_meta,
                         "tool_count": len(payload.tool_calls),
@@ -69,7 +71,7 @@ class LangfuseProvider:
                     ) as tool_obs:
                         tool_obs.update(output=tc.output)
 
-                trace_span.update(output={"role": "assistant", "content": payload.assistant_text})
+                trace_span.update(output=assistant_output)
 
     def emit_metric(
         self,
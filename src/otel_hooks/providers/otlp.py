@@ -13,13 +13,19 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from otel_hooks.domain.transcript import MAX_CHARS_DEFAULT, Turn
 from otel_hooks.providers.common import build_turn_payload
 
+# A hook process lives for one event and exports everything in flush(), so
+# size the queue for a whole resumed session. The export batch size stays at
+# the SDK default: spans carry up to max_chars of text per attribute, and
+# larger batches risk exceeding receivers' request body limits.
+_MAX_QUEUE_SIZE = 8192
+
 
 class OTLPProvider:
     def __init__(self, endpoint: str, headers: dict[str, str] | None = None, *, max_chars: int = MAX_CHARS_DEFAULT) -> None:
         resource = Resource.create({"service.name": "otel-hooks"})
         exporter = OTLPSpanExporter(endpoint=endpoint, headers=headers or {})
         provider = TracerProvider(resource=resource)
-        provider.add_span_processor(BatchSpanProcessor(exporter))
+        provider.add_span_processor(BatchSpanProcessor(exporter, max_queue_size=_MAX_QUEUE_SIZE))
         self._provider = provider
         self._tracer = provider.get_tracer("otel-hooks")
         self._max_chars = max_chars
@@ -32,6 +38,7 @@ class OTLPProvider:
             "gen_ai.request.model": payload.model,
             "gen_ai.prompt": payload.user_text,
             "gen_ai.completion": payload.assistant_text,
+            "gen_ai.usage.tool_count": len(payload.tool_calls),
         }
         if transcript_path is not None:
             attrs["transcript_path"] = str(transcript_path)
@@ -42,17 +49,6 @@ class OTLPProvider:
             span_name,
             attributes=attrs,
         ):
-            with self._tracer.start_as_current_span(
-                "Assistant Response",
-                attributes={
-                    "gen_ai.request.model": payload.model,
-                    "gen_ai.prompt": payload.user_text,
-                    "gen_ai.completion": payload.assistant_text,
-                    "gen_ai.usage.tool_count": len(payload.tool_calls),
-                },
-            ):
-                pass
-
             for tc in payload.tool_calls:
                 in_str = tc.input if isinstance(tc.input, str) else json.dumps(tc.input, ensure_ascii=False)
                 with self._tracer.start_as_current_span(
@@ -7,28 +7,36 @@ import json
 import logging
 import os
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from otel_hooks import json_codec
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_STATE_DIR = Path.home() / ".config" / "otel-hooks" / "state"
 
+# Session files untouched for this long are pruned when a new session starts.
+SESSION_STATE_MAX_AGE_S = 30 * 24 * 60 * 60
+
 
 @dataclass(frozen=True)
 class StatePaths:
     state_dir: Path
     state_file: Path
     lock_file: Path
+    sessions_dir: Path
 
 
 def build_state_paths(state_dir: Path) -> StatePaths:
     return StatePaths(
         state_dir=state_dir,
+        # Legacy single-file state; read only to migrate sessions predating sessions_dir.
         state_file=state_dir / "otel_hook_state.json",
         lock_file=state_dir / "otel_hook_state.lock",
+        sessions_dir=state_dir / "sessions",
     )
 
 
@@ -40,21 +48,28 @@ class FileLock:
         self._fcntl = None
 
     def __enter__(self):
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._fh = open(self.path, "a+", encoding="utf-8")
+        try:
+            self._fh = open(self.path, "a+", encoding="utf-8")
+        except FileNotFoundError:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a+", encoding="utf-8")
         try:
             import fcntl
 
             self._fcntl = fcntl
-            deadline = time.time() + self.timeout_s
+            deadline = time.monotonic() + self.timeout_s
+            # Back off exponentially so a briefly contended lock is picked up
+            # within a few ms instead of a fixed 50 ms tick.
+            delay = 0.001
             while True:
                 try:
                     fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
                     break
                 except BlockingIOError:
-                    if time.time() > deadline:
+                    if time.monotonic() > deadline:
                         break
-                    time.sleep(0.05)
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.05)
         except ImportError:
             pass
         return self
@@ -70,6 +85,8 @@ class SessionState:
     offset: int = 0
     buffer: str = ""
     turn_count: int = 0
+    # True when nothing was stored for the session yet; not persisted.
+    is_new: bool = field(default=False, compare=False, repr=False)
 
 
 def state_key(session_id: str, transcript_path: str) -> str:
@@ -77,20 +94,19 @@ def state_key(session_id: str, transcript_path: str) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
-def load_state(state_file: Path) -> dict[str, Any]:
-    if not state_file.exists():
-        return {}
-    return json.loads(state_file.read_text(encoding="utf-8"))
+def session_state_file(paths: StatePaths, key: str) -> Path:
+    return paths.sessions_dir / f"{key}.json"
 
 
-def save_state(state: dict[str, Any], state_file: Path) -> None:
-    from otel_hooks.file_io import atomic_write
-
-    atomic_write(state_file, json.dumps(state, indent=2, sort_keys=True).encode("utf-8"))
+def _load_legacy_session(paths: StatePaths, key: str) -> dict[str, Any]:
+    try:
+        data = paths.state_file.read_bytes()
+    except FileNotFoundError:
+        return {}
+    return json_codec.loads(data).get(key, {})
 
 
-def load_session_state(global_state: dict[str, Any], key: str) -> SessionState:
-    s = global_state.get(key, {})
+def _session_state_from(s: dict[str, Any]) -> SessionState:
     return SessionState(
         offset=int(s.get("offset", 0)),
         buffer=str(s.get("buffer", "")),
@@ -98,19 +114,92 @@ def load_session_state(global_state: dict[str, Any], key: str) -> SessionState:
     )
 
 
-def write_session_state(global_state: dict[str, Any], key: str, ss: SessionState) -> None:
-    global_state[key] = {
+def _encode_session_state(ss: SessionState) -> bytes:
+    data = {
         "offset": ss.offset,
         "buffer": ss.buffer,
         "turn_count": ss.turn_count,
         "updated": datetime.now(timezone.utc).isoformat(),
     }
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _migrate_legacy_session(path: Path, ss: SessionState) -> None:
+    """Copy a legacy entry to its per-session file unless one already exists.
+
+    May run outside the state lock, so it links into place instead of
+    replacing: state written concurrently by a lock holder is never clobbered.
+    """
+    from otel_hooks.file_io import atomic_write
+
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.migrate")
+    try:
+        atomic_write(tmp, _encode_session_state(ss))
+        os.link(tmp, path)
+    except FileExistsError:
+        pass
+    except OSError:
+        logger.debug("Failed to migrate legacy session state to %s", path, exc_info=True)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def load_session_state(paths: StatePaths, key: str) -> SessionState:
+    """Load one session's state from its own file under ``sessions_dir``."""
+    path = session_state_file(paths, key)
+    try:
+        return _session_state_from(json_codec.loads(path.read_bytes()))
+    except FileNotFoundError:
+        pass
+    legacy = _load_legacy_session(paths, key)
+    if not legacy:
+        return SessionState(is_new=True)
+    ss = _session_state_from(legacy)
+    # Later fires then read this file instead of parsing every legacy session.
+    _migrate_legacy_session(path, ss)
+    return ss
+
+
+def write_session_state(paths: StatePaths, key: str, ss: SessionState) -> None:
+    from otel_hooks.file_io import atomic_write
+
+    atomic_write(session_state_file(paths, key), _encode_session_state(ss))
+    if ss.is_new:
+        ss.is_new = False
+        prune_session_states(paths)
+
+
+def prune_session_states(paths: StatePaths, max_age_s: float = SESSION_STATE_MAX_AGE_S) -> int:
+    """Remove session files not updated within ``max_age_s``. Returns the count removed."""
+    cutoff = time.time() - max_age_s
+    removed = 0
+    try:
+        entries = list(os.scandir(paths.sessions_dir))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                removed += 1
+        except OSError:
+            logger.debug("Failed to prune session state %s", entry.path, exc_info=True)
+    return removed
 
 
 def read_new_jsonl_lines(transcript_path: Path, ss: SessionState) -> tuple[list[str], SessionState]:
     """Read new lines from transcript file (written by external AI tools)."""
-    if not transcript_path.exists():
+    try:
+        size = transcript_path.stat().st_size
+    except OSError:
         return [], ss
+    # Most hook fires arrive with nothing new appended; skip open/seek/read.
+    if size == ss.offset and not ss.buffer:
+        return [], ss
+    if size < ss.offset:
+        # Transcript was truncated or replaced; start over from the top.
+        ss.offset = 0
+        ss.buffer = ""
     try:
         with open(transcript_path, "rb") as f:
             f.seek(ss.offset)
@@ -123,10 +212,13 @@ def read_new_jsonl_lines(transcript_path: Path, ss: SessionState) -> tuple[list[
     if not chunk:
         return [], ss
 
-    text = chunk.decode("utf-8", errors="replace")
-
-    combined = ss.buffer + text
-    lines = combined.split("\n")
-    ss.buffer = lines[-1]
+    data = ss.buffer.encode("utf-8") + chunk if ss.buffer else chunk
     ss.offset = new_offset
-    return lines[:-1], ss
+    # Split on the raw bytes so the trailing partial line is never decoded
+    # together with (and copied alongside) the complete ones.
+    last_nl = data.rfind(b"\n")
+    if last_nl < 0:
+        ss.buffer = data.decode("utf-8", errors="replace")
+        return [], ss
+    ss.buffer = data[last_nl + 1 :].decode("utf-8", errors="replace")
+    return data[:last_nl].decode("utf-8", errors="replace").split("\n"), ss
@@ -11,6 +11,11 @@ from typing import Any, Dict, Protocol, runtime_checkable
 from openhook import OpenHookEvent, ValidationError, from_legacy, is_openhook
 
 
+# Substring identifying otel-hooks entries in tool hook settings. Registered
+# commands may carry flags (e.g. "--provider otlp --tool kiro").
+HOOK_COMMAND = "otel-hooks hook"
+
+
 class Scope(str, Enum):
     GLOBAL = "global"
     PROJECT = "project"
@@ -34,27 +39,40 @@ class ToolConfig(Protocol):
 
 
 TOOL_REGISTRY: Dict[str, type[ToolConfig]] = {}
+_AVAILABLE_TOOLS: tuple[str, ...] | None = None
+# Tool configs are stateless, so one instance per name is shared by callers.
+_TOOL_CACHE: Dict[str, ToolConfig] = {}
 
 
 def register_tool(cls: type[ToolConfig]) -> type[ToolConfig]:
     """Class decorator to register a tool config."""
+    global _AVAILABLE_TOOLS
     instance = cls()
     TOOL_REGISTRY[instance.name] = cls
+    _TOOL_CACHE.pop(instance.name, None)
+    _AVAILABLE_TOOLS = None
     return cls
 
 
 def get_tool(name: str) -> ToolConfig:
     """Get a tool config instance by name."""
+    tool = _TOOL_CACHE.get(name)
+    if tool is not None:
+        return tool
     _ensure_registered()
     if name not in TOOL_REGISTRY:
         raise ValueError(f"Unknown tool: {name}. Available: {list(TOOL_REGISTRY.keys())}")
-    return TOOL_REGISTRY[name]()
+    tool = _TOOL_CACHE[name] = TOOL_REGISTRY[name]()
+    return tool
 
 
-def available_tools() -> list[str]:
-    """Return names of all registered tools."""
-    _ensure_registered()
-    return sorted(TOOL_REGISTRY.keys())
+def available_tools() -> tuple[str, ...]:
+    """Return names of all registered tools, sorted."""
+    global _AVAILABLE_TOOLS
+    if _AVAILABLE_TOOLS is None:
+        _ensure_registered()
+        _AVAILABLE_TOOLS = tuple(sorted(TOOL_REGISTRY))
+    return _AVAILABLE_TOOLS
 
 
 def _ensure_registered() -> None:
@@ -7,10 +7,17 @@ Reference:
 from pathlib import Path
 from typing import Any, Dict
 
-from . import Scope, register_tool
+from . import HOOK_COMMAND, Scope, register_tool
 from .json_io import load_json, save_json
 
-HOOK_COMMAND = "otel-hooks hook"
+
+def _locate_hook(settings: Dict[str, Any], command: str) -> tuple[int, int] | None:
+    """Return (group index, hook index) of the first Stop hook running *command*."""
+    for gi, group in enumerate(settings.get("hooks", {}).get("Stop", ())):
+        for hi, hook in enumerate(group.get("hooks", ())):
+            if command in hook.get("command", ""):
+                return gi, hi
+    return None
 
 
 @register_tool
@@ -36,33 +43,25 @@ class ClaudeConfig:
         save_json(self.settings_path(scope), settings)
 
     def is_hook_registered(self, settings: Dict[str, Any]) -> bool:
-        stop_hooks = settings.get("hooks", {}).get("Stop", [])
-        for group in stop_hooks:
-            for hook in group.get("hooks", []):
-                if HOOK_COMMAND in hook.get("command", ""):
-                    return True
-        return False
+        return _locate_hook(settings, HOOK_COMMAND) is not None
 
     def register_hook(self, settings: Dict[str, Any], command: str | None = None) -> Dict[str, Any]:
         cmd = command or HOOK_COMMAND
-        hooks = settings.setdefault("hooks", {})
-        stop = hooks.setdefault("Stop", [])
-        for group in stop:
-            for hook in group.get("hooks", []):
-                if cmd in hook.get("command", ""):
-                    return settings
+        if _locate_hook(settings, cmd) is not None:
+            return settings
+        stop = settings.setdefault("hooks", {}).setdefault("Stop", [])
         stop.append({"hooks": [{"type": "command", "command": cmd, "async": True}]})
         return settings
 
     def unregister_hook(self, settings: Dict[str, Any]) -> Dict[str, Any]:
-        stop = settings.get("hooks", {}).get("Stop", [])
+        stop = settings.get("hooks", {}).get("Stop")
         if not stop:
             return settings
-        settings["hooks"]["Stop"] = [
-            group for group in stop
-            if not any(HOOK_COMMAND in hook.get("command", "") for hook in group.get("hooks", []))
-        ]
-        if not settings["hooks"]["Stop"]:
+        # Delete matches in place (back to front) instead of rebuilding the list.
+        for i in range(len(stop) - 1, -1, -1):
+            if any(HOOK_COMMAND in hook.get("command", "") for hook in stop[i].get("hooks", ())):
+                del stop[i]
+        if not stop:
             del settings["hooks"]["Stop"]
         return settings
 
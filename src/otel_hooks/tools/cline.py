@@ -12,9 +12,8 @@ import os
 from pathlib import Path
 from typing import Any, Dict
 
-from . import Scope, register_tool
+from . import HOOK_COMMAND, Scope, register_tool
 
-HOOK_COMMAND = "otel-hooks hook"
 HOOK_SCRIPT = "TaskComplete"
 
 
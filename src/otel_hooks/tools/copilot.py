@@ -9,7 +9,7 @@ Reference:
 from pathlib import Path
 from typing import Any, Dict
 
-from . import Scope, register_tool
+from . import HOOK_COMMAND, Scope, register_tool
 from .json_io import load_json, save_json
 
 HOOKS_FILE = "otel-hooks.json"
@@ -49,18 +49,18 @@ class CopilotConfig:
     def is_hook_registered(self, settings: Dict[str, Any]) -> bool:
         hooks = settings.get("hooks", {})
         return all(
-            any("otel-hooks hook" in hook.get("bash", "") for hook in hooks.get(event_name, []))
+            any(HOOK_COMMAND in hook.get("bash", "") for hook in hooks.get(event_name, []))
             for event_name in _HOOK_EVENTS
         )
 
     def register_hook(self, settings: Dict[str, Any], command: str | None = None) -> Dict[str, Any]:
-        base_cmd = command or "otel-hooks hook"
+        base_cmd = command or HOOK_COMMAND
         cmd = f"{base_cmd} --tool copilot"
         settings.setdefault("version", 1)
         hooks = settings.setdefault("hooks", {})
         for event_name in _HOOK_EVENTS:
             group = hooks.setdefault(event_name, [])
-            if any("otel-hooks hook" in hook.get("bash", "") for hook in group):
+            if any(HOOK_COMMAND in hook.get("bash", "") for hook in group):
                 continue
             group.append(
                 {
@@ -77,10 +77,10 @@ class CopilotConfig:
             group = hooks.get(event_name, [])
             if not group:
                 continue
-            hooks[event_name] = [
-                hook for hook in group if "otel-hooks hook" not in hook.get("bash", "")
-            ]
-            if not hooks[event_name]:
+            for i in range(len(group) - 1, -1, -1):
+                if HOOK_COMMAND in group[i].get("bash", ""):
+                    del group[i]
+            if not group:
                 del hooks[event_name]
         return settings
 
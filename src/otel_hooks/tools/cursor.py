@@ -7,11 +7,9 @@ Reference:
 from pathlib import Path
 from typing import Any, Dict
 
-from . import Scope, register_tool
+from . import HOOK_COMMAND, Scope, register_tool
 from .json_io import load_json, save_json
 
-HOOK_COMMAND = "otel-hooks hook"
-
 
 @register_tool
 class CursorConfig:
@@ -7,7 +7,7 @@ Reference:
 from pathlib import Path
 from typing import Any, Dict
 
-from . import Scope, register_tool
+from . import HOOK_COMMAND, Scope, register_tool
 from .json_io import load_json, save_json
 
 AGENT_FILE = "default.json"
@@ -38,17 +38,17 @@ class KiroConfig:
     def is_hook_registered(self, settings: Dict[str, Any]) -> bool:
         hooks = settings.get("hooks", {})
         return all(
-            any("otel-hooks hook" in hook.get("command", "") for hook in hooks.get(event_name, []))
+            any(HOOK_COMMAND in hook.get("command", "") for hook in hooks.get(event_name, []))
             for event_name in _HOOK_EVENTS
         )
 
     def register_hook(self, settings: Dict[str, Any], command: str | None = None) -> Dict[str, Any]:
-        base_cmd = command or "otel-hooks hook"
+        base_cmd = command or HOOK_COMMAND
         cmd = f"{base_cmd} --tool kiro"
         hooks = settings.setdefault("hooks", {})
         for event_name in _HOOK_EVENTS:
             group = hooks.setdefault(event_name, [])
-            if any("otel-hooks hook" in hook.get("command", "") for hook in group):
+            if any(HOOK_COMMAND in hook.get("command", "") for hook in group):
                 continue
             group.append({"command": cmd})
         return settings
@@ -59,10 +59,10 @@ class KiroConfig:
             group = hooks.get(event_name, [])
             if not group:
                 continue
-            hooks[event_name] = [
-                hook for hook in group if "otel-hooks hook" not in hook.get("command", "")
-            ]
-            if not hooks[event_name]:
+            for i in range(len(group) - 1, -1, -1):
+                if HOOK_COMMAND in group[i].get("command", ""):
+                    del group[i]
+            if not group:
                 del hooks[event_name]
         return settings
 
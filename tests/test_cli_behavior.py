@@ -215,6 +215,18 @@ class CliBehaviorTest(unittest.TestCase):
             with self.assertRaises(SystemExit):
                 cli._resolve_provider(_args(provider=None))
 
+    def test_main_dispatches_hook_without_building_parser(self) -> None:
+        argv = ["otel-hooks", "hook", "--provider", "datadog", "--tool", "claude"]
+        with patch.object(cli.sys, "argv", argv), patch(
+            "otel_hooks.hook.main", return_value=0
+        ) as hook_main, patch("otel_hooks.cli.argparse.ArgumentParser") as parser_cls:
+            with self.assertRaises(SystemExit) as ctx:
+                cli.main()
+
+        self.assertEqual(ctx.exception.code, 0)
+        hook_main.assert_called_once_with()
+        parser_cls.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
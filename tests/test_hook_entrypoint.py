@@ -38,6 +38,15 @@ class HookEntrypointTest(unittest.TestCase):
 
         self.assertNotIn("source_tool", payload)
 
+    def test_read_hook_payload_reads_stdin_bytes(self) -> None:
+        raw = '{"session_id":"s-1","prompt":"héllo"}'.encode("utf-8")
+        stdin = io.TextIOWrapper(io.BytesIO(raw), encoding="ascii")
+
+        with patch("sys.stdin", stdin):
+            payload = read_hook_payload()
+
+        self.assertEqual(payload, {"session_id": "s-1", "prompt": "héllo"})
+
 
 if __name__ == "__main__":
     unittest.main()
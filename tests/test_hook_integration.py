@@ -119,21 +119,50 @@ class HookIntegrationTest(unittest.TestCase):
             self.assertTrue(provider1.flush_called)
             self.assertTrue(provider1.shutdown_called)
 
-            # 同一 payload を再実行しても state により再送しない
+            # 同一 payload を再実行しても state により再送しない (provider も生成しない)
             rc2 = hook.run_hook(payload, config, provider_factory=provider_factory)
 
             self.assertEqual(rc2, 0)
+            self.assertEqual(providers, [provider2])
             self.assertEqual(provider2.emitted, [])
             self.assertFalse(provider2.flush_called)
-            self.assertTrue(provider2.shutdown_called)
+            self.assertFalse(provider2.shutdown_called)
 
-            state_file = root / "state" / "otel_hook_state.json"
-            self.assertTrue(state_file.exists())
-            state = json.loads(state_file.read_text(encoding="utf-8"))
-            self.assertEqual(len(state), 1)
-            saved = next(iter(state.values()))
+            session_files = list((root / "state" / "sessions").glob("*.json"))
+            self.assertEqual(len(session_files), 1)
+            saved = json.loads(session_files[0].read_text(encoding="utf-8"))
             self.assertEqual(saved["turn_count"], 1)
 
+    def test_run_hook_does_not_rewrite_state_when_transcript_is_unchanged(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            transcript = root / "session.jsonl"
+            transcript.write_text(
+                json.dumps({"type": "user", "message": {"role": "user", "content": "hello"}})
+                + "\n"
+                + json.dumps(
+                    {
+                        "type": "assistant",
+                        "message": {"id": "a1", "role": "assistant", "content": "world"},
+                    }
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+            payload = {"sessionId": "s-1", "transcriptPath": str(transcript)}
+            config = {"provider": "langfuse", "debug": False, "state_dir": str(root / "state")}
+
+            hook.run_hook(payload, config, provider_factory=lambda _name, _cfg: _StubProvider())
+            (state_file,) = (root / "state" / "sessions").glob("*.json")
+            before = state_file.stat()
+
+            rc = hook.run_hook(payload, config, provider_factory=lambda _name, _cfg: _StubProvider())
+
+            self.assertEqual(rc, 0)
+            after = state_file.stat()
+            self.assertEqual(before.st_ino, after.st_ino)
+            self.assertEqual(before.st_mtime_ns, after.st_mtime_ns)
+
     def test_run_hook_emits_metrics_for_metrics_only_event(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             root = Path(td)
@@ -157,7 +186,18 @@ class HookIntegrationTest(unittest.TestCase):
         with tempfile.TemporaryDirectory() as td:
             root = Path(td)
             transcript = root / "session.jsonl"
-            transcript.write_text("", encoding="utf-8")
+            transcript.write_text(
+                json.dumps({"type": "user", "message": {"role": "user", "content": "hello"}})
+                + "\n"
+                + json.dumps(
+                    {
+                        "type": "assistant",
+                        "message": {"id": "a1", "role": "assistant", "content": "world"},
+                    }
+                )
+                + "\n",
+                encoding="utf-8",
+            )
             payload = {"sessionId": "s-1", "transcriptPath": str(transcript)}
             config = {
                 "provider": "langfuse",
@@ -233,10 +273,8 @@ class HookIntegrationTest(unittest.TestCase):
             self.assertEqual(rc, 1)
             self.assertTrue(provider.shutdown_called)
 
-            state_file = root / "state" / "otel_hook_state.json"
-            self.assertTrue(state_file.exists())
-            state = json.loads(state_file.read_text(encoding="utf-8"))
-            saved = next(iter(state.values()))
+            (state_file,) = (root / "state" / "sessions").glob("*.json")
+            saved = json.loads(state_file.read_text(encoding="utf-8"))
             # 送信失敗時は再送可能性のため turn_count を進めない
             self.assertEqual(saved["turn_count"], 0)
             self.assertEqual(saved["offset"], 0)
@@ -383,8 +421,8 @@ class HookIntegrationTest(unittest.TestCase):
             self.assertEqual(rc_b, 0)
             self.assertEqual(provider_a.emitted, [("s-a", 1)])
             self.assertEqual(provider_b.emitted, [("s-b", 1)])
-            self.assertTrue((root / "state-a" / "otel_hook_state.json").exists())
-            self.assertTrue((root / "state-b" / "otel_hook_state.json").exists())
+            self.assertEqual(len(list((root / "state-a" / "sessions").glob("*.json"))), 1)
+            self.assertEqual(len(list((root / "state-b" / "sessions").glob("*.json"))), 1)
 
 
 if __name__ == "__main__":
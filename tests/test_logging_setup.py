@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from unittest.mock import patch
@@ -30,7 +31,9 @@ class TestConfigure:
         pkg = logging.getLogger(_PACKAGE)
         assert len(pkg.handlers) == 2
         handler_types = {type(h).__name__ for h in pkg.handlers}
-        assert "RotatingFileHandler" in handler_types
+        assert "MemoryHandler" in handler_types
+        buffered = next(h for h in pkg.handlers if isinstance(h, logging.handlers.MemoryHandler))
+        assert isinstance(buffered.target, logging.handlers.RotatingFileHandler)
         assert "StreamHandler" in handler_types
 
     def test_idempotent_without_reconfigure(self, tmp_path: Path):
@@ -80,6 +83,23 @@ class TestConfigure:
         content = log_file.read_text()
         assert "test message" in content
 
+    def test_warning_is_written_without_explicit_flush(self, tmp_path: Path):
+        log_file = tmp_path / "test.log"
+        configure(log_file, debug=True)
+        test_logger = logging.getLogger(f"{_PACKAGE}.test_module")
+        test_logger.info("buffered message")
+        test_logger.warning("urgent message")
+        content = log_file.read_text()
+        assert "buffered message" in content
+        assert "urgent message" in content
+
+    def test_reconfigure_flushes_buffered_records(self, tmp_path: Path):
+        log_file = tmp_path / "first.log"
+        configure(log_file, debug=True)
+        logging.getLogger(f"{_PACKAGE}.test_module").info("before reconfigure")
+        configure(tmp_path / "second.log", reconfigure=True)
+        assert "before reconfigure" in log_file.read_text()
+
     def test_propagate_is_false(self, tmp_path: Path):
         configure(tmp_path / "test.log")
         pkg = logging.getLogger(_PACKAGE)
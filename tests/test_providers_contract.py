@@ -167,8 +167,9 @@ def _build_fake_otlp_modules() -> dict[str, types.ModuleType]:
             self.shutdown_called = True
 
     class BatchSpanProcessor:
-        def __init__(self, exporter: OTLPSpanExporter) -> None:
+        def __init__(self, exporter: OTLPSpanExporter, **kwargs: int) -> None:
             self.exporter = exporter
+            self.kwargs = kwargs
 
     trace_exporter_mod.OTLPSpanExporter = OTLPSpanExporter
     resources_mod.Resource = Resource
@@ -241,11 +242,16 @@ class ProviderContractTest(unittest.TestCase):
         self.assertEqual(fake_provider.resource["service.name"], "otel-hooks")
         self.assertEqual(fake_provider.processors[0].exporter.endpoint, "http://collector")
         self.assertEqual(fake_provider.processors[0].exporter.headers, {"x-auth": "abc"})
+        self.assertEqual(
+            fake_provider.processors[0].kwargs,
+            {"max_queue_size": 8192},
+        )
         self.assertEqual(spans[0].payload["name"], "claude - Turn 1")
         self.assertEqual(spans[0].payload["attributes"]["source_tool"], "claude")
-        self.assertEqual(spans[2].payload["name"], "Tool: read")
-        self.assertEqual(spans[3].payload["name"], "Metric - tool_started")
-        self.assertEqual(spans[3].payload["attributes"]["metric.attr.tool_name"], "read")
+        self.assertEqual(spans[0].payload["attributes"]["gen_ai.usage.tool_count"], 1)
+        self.assertEqual(spans[1].payload["name"], "Tool: read")
+        self.assertEqual(spans[2].payload["name"], "Metric - tool_started")
+        self.assertEqual(spans[2].payload["attributes"]["metric.attr.tool_name"], "read")
         self.assertTrue(fake_provider.force_flush_called)
         self.assertTrue(fake_provider.shutdown_called)
 
@@ -263,6 +269,8 @@ class ProviderContractTest(unittest.TestCase):
         self.assertEqual(spans[0].name, "ai_session.turn")
         self.assertEqual(spans[0].meta["source_tool"], "claude")
         self.assertEqual(spans[2].name, "ai_session.tool")
+        self.assertEqual({s.parent_id for s in spans[1:3]}, {spans[0].span_id})
+        self.assertEqual({s.trace_id for s in spans[1:3]}, {spans[0].trace_id})
         self.assertEqual(spans[3].name, "ai_session.metric")
         self.assertEqual(spans[3].meta["metric.attr.tool_name"], "read")
 
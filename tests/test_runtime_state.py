@@ -2,11 +2,24 @@ from __future__ import annotations
 
 import tests._path_setup  # noqa: F401
 
+import json
+import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
-from otel_hooks.runtime.state import SessionState, read_new_jsonl_lines
+from otel_hooks.runtime.state import (
+    SESSION_STATE_MAX_AGE_S,
+    FileLock,
+    SessionState,
+    build_state_paths,
+    load_session_state,
+    prune_session_states,
+    read_new_jsonl_lines,
+    session_state_file,
+    write_session_state,
+)
 
 
 class RuntimeStateTest(unittest.TestCase):
@@ -33,6 +46,86 @@ class RuntimeStateTest(unittest.TestCase):
             self.assertEqual(lines, [])
             self.assertEqual(ss2.offset, 0)
 
+    def test_read_new_jsonl_lines_restarts_when_transcript_shrinks(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "t.jsonl"
+            path.write_text('{"b":2}\n', encoding="utf-8")
+
+            ss = SessionState(offset=100, buffer="", turn_count=3)
+            lines, ss = read_new_jsonl_lines(path, ss)
+
+            self.assertEqual(lines, ['{"b":2}'])
+            self.assertEqual(ss.offset, 8)
+
+    def test_session_state_round_trips_through_per_session_file(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            paths = build_state_paths(Path(td))
+            write_session_state(paths, "k1", SessionState(offset=10, buffer="{", turn_count=2))
+
+            ss = load_session_state(paths, "k1")
+
+            self.assertEqual((ss.offset, ss.buffer, ss.turn_count), (10, "{", 2))
+            self.assertTrue(session_state_file(paths, "k1").exists())
+            self.assertEqual(load_session_state(paths, "k2"), SessionState())
+
+    def test_load_session_state_falls_back_to_legacy_state_file(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            paths = build_state_paths(Path(td))
+            paths.state_file.write_text(
+                json.dumps({"k1": {"offset": 5, "buffer": "", "turn_count": 1}}),
+                encoding="utf-8",
+            )
+
+            ss = load_session_state(paths, "k1")
+
+            self.assertEqual((ss.offset, ss.turn_count), (5, 1))
+            self.assertFalse(ss.is_new)
+            # 移行後は legacy ファイルを読まずに済む
+            paths.state_file.unlink()
+            migrated = load_session_state(paths, "k1")
+            self.assertEqual((migrated.offset, migrated.turn_count), (5, 1))
+            self.assertEqual(sorted(p.name for p in paths.sessions_dir.iterdir()), ["k1.json"])
+
+    def test_write_session_state_prunes_only_for_new_sessions(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            paths = build_state_paths(Path(td))
+            write_session_state(paths, "old", SessionState())
+            stale = time.time() - SESSION_STATE_MAX_AGE_S - 60
+            os.utime(session_state_file(paths, "old"), (stale, stale))
+
+            existing = load_session_state(paths, "old")
+            write_session_state(paths, "old", existing)
+            os.utime(session_state_file(paths, "old"), (stale, stale))
+            self.assertTrue(session_state_file(paths, "old").exists())
+
+            fresh = load_session_state(paths, "new")
+            self.assertTrue(fresh.is_new)
+            write_session_state(paths, "new", fresh)
+
+            self.assertFalse(fresh.is_new)
+            self.assertFalse(session_state_file(paths, "old").exists())
+            self.assertTrue(session_state_file(paths, "new").exists())
+
+    def test_prune_session_states_removes_only_stale_files(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            paths = build_state_paths(Path(td))
+            write_session_state(paths, "old", SessionState())
+            write_session_state(paths, "new", SessionState())
+            stale = time.time() - 3600
+            os.utime(session_state_file(paths, "old"), (stale, stale))
+
+            removed = prune_session_states(paths, max_age_s=60)
+
+            self.assertEqual(removed, 1)
+            self.assertFalse(session_state_file(paths, "old").exists())
+            self.assertTrue(session_state_file(paths, "new").exists())
+
+    def test_file_lock_creates_missing_state_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            lock_path = Path(td) / "nested" / "state" / "otel_hook_state.lock"
+            with FileLock(lock_path):
+                self.assertTrue(lock_path.exists())
+
 
 if __name__ == "__main__":
     unittest.main()
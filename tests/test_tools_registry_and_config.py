@@ -13,6 +13,29 @@ from otel_hooks.tools import Scope, available_tools, get_tool
 
 
 class ToolsRegistryAndConfigTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One fixture tree for the class; tests only rewrite the config files.
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.root = Path(cls._tmp.name)
+        cls.project_file = cls.root / ".otel-hooks.json"
+        cls.global_file = cls.root / ".config" / "otel-hooks" / "config.json"
+        cls.global_file.parent.mkdir(parents=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
+
+    def setUp(self) -> None:
+        for target in ("otel_hooks.config.Path.cwd", "otel_hooks.config.Path.home"):
+            patcher = patch(target, return_value=self.root)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _write_configs(self, *, project: str, global_: str) -> None:
+        self.project_file.write_text(project, encoding="utf-8")
+        self.global_file.write_text(global_, encoding="utf-8")
+
     def test_available_tools_contains_supported_tools(self) -> None:
         tools = available_tools()
         self.assertIn("claude", tools)
@@ -21,64 +44,61 @@ class ToolsRegistryAndConfigTest(unittest.TestCase):
         self.assertIn("copilot", tools)
         self.assertIn("kiro", tools)
         self.assertIn("opencode", tools)
-        self.assertEqual(tools, sorted(tools))
+        self.assertEqual(list(tools), sorted(tools))
+        self.assertIs(available_tools(), tools)
 
     def test_get_tool_returns_config_instance(self) -> None:
         claude = get_tool("claude")
         self.assertEqual(claude.name, "claude")
         self.assertIn(Scope.GLOBAL, claude.scopes())
+        self.assertIs(get_tool("claude"), claude)
 
     def test_load_raw_config_reads_single_scope_without_merge(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            (root / ".otel-hooks.json").write_text('{"provider": "otlp"}', encoding="utf-8")
-            cfg_dir = root / ".config" / "otel-hooks"
-            cfg_dir.mkdir(parents=True, exist_ok=True)
-            (cfg_dir / "config.json").write_text('{"provider": "langfuse"}', encoding="utf-8")
-
-            with patch("otel_hooks.config.Path.cwd", return_value=root), patch(
-                "otel_hooks.config.Path.home", return_value=root
-            ):
-                project_cfg = config.load_raw_config(Scope.PROJECT)
-                global_cfg = config.load_raw_config(Scope.GLOBAL)
-
-            self.assertEqual(project_cfg["provider"], "otlp")
-            self.assertEqual(global_cfg["provider"], "langfuse")
-
-    def test_load_config_applies_env_override_last(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            (root / ".otel-hooks.json").write_text('{"debug": false}', encoding="utf-8")
-            cfg_dir = root / ".config" / "otel-hooks"
-            cfg_dir.mkdir(parents=True, exist_ok=True)
-            (cfg_dir / "config.json").write_text('{"debug": false}', encoding="utf-8")
-
-            with patch.dict(os.environ, {"OTEL_HOOKS_DEBUG": "true"}, clear=False), patch(
-                "otel_hooks.config.Path.cwd", return_value=root
-            ), patch("otel_hooks.config.Path.home", return_value=root):
-                merged = config.load_config()
-
-            self.assertEqual(merged["debug"], True)
-
-    def test_load_config_applies_provider_env_for_all_configured_providers(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            (root / ".otel-hooks.json").write_text('{"langfuse": {}, "otlp": {}}', encoding="utf-8")
-            cfg_dir = root / ".config" / "otel-hooks"
-            cfg_dir.mkdir(parents=True, exist_ok=True)
-            (cfg_dir / "config.json").write_text("{}", encoding="utf-8")
-
-            with patch.dict(
-                os.environ,
+        self._write_configs(project='{"provider": "otlp"}', global_='{"provider": "langfuse"}')
+
+        project_cfg = config.load_raw_config(Scope.PROJECT)
+        global_cfg = config.load_raw_config(Scope.GLOBAL)
+
+        self.assertEqual(project_cfg["provider"], "otlp")
+        self.assertEqual(global_cfg["provider"], "langfuse")
+
+    def test_load_raw_config_sees_rewrites_and_missing_file(self) -> None:
+        config.save_config({"otlp": {"endpoint": "a"}}, Scope.PROJECT)
+        self.assertEqual(config.load_raw_config(Scope.PROJECT)["otlp"]["endpoint"], "a")
+
+        config.save_config({"otlp": {"endpoint": "b"}}, Scope.PROJECT)
+        self.assertEqual(config.load_raw_config(Scope.PROJECT)["otlp"]["endpoint"], "b")
+
+        self.project_file.unlink()
+        self.assertEqual(config.load_raw_config(Scope.PROJECT), {})
+
+    def test_load_config_applies_env_overrides_last(self) -> None:
+        cases = [
+            (
+                "top_level_key",
+                '{"debug": false}',
+                '{"debug": false}',
+                {"OTEL_HOOKS_DEBUG": "true"},
+                [(("debug",), True)],
+            ),
+            (
+                "all_configured_providers",
+                '{"langfuse": {}, "otlp": {}}',
+                "{}",
                 {"LANGFUSE_PUBLIC_KEY": "pk", "OTEL_EXPORTER_OTLP_ENDPOINT": "http://localhost:4318"},
-                clear=False,
-            ), patch(
-                "otel_hooks.config.Path.cwd", return_value=root
-            ), patch("otel_hooks.config.Path.home", return_value=root):
-                merged = config.load_config()
-
-            self.assertEqual(merged["langfuse"]["public_key"], "pk")
-            self.assertEqual(merged["otlp"]["endpoint"], "http://localhost:4318")
+                [(("langfuse", "public_key"), "pk"), (("otlp", "endpoint"), "http://localhost:4318")],
+            ),
+        ]
+        for name, project, global_, env, expected in cases:
+            with self.subTest(case=name):
+                self._write_configs(project=project, global_=global_)
+                with patch.dict(os.environ, env, clear=False):
+                    merged = config.load_config()
+                for path, value in expected:
+                    actual = merged
+                    for key in path:
+                        actual = actual[key]
+                    self.assertEqual(actual, value)
 
 
 if __name__ == "__main__":
@@ -73,6 +73,34 @@ class TranscriptDomainTest(unittest.TestCase):
         assistant_text = transcript.extract_text(transcript.get_content(turns[0].assistant_msgs[0]))
         self.assertEqual(assistant_text, "final answer")
 
+    def test_classify_matches_individual_accessors(self) -> None:
+        messages = [
+            {"type": "user", "message": {"role": "user", "content": "hi"}},
+            {"message": {"role": "assistant", "content": [{"type": "text", "text": "x"}]}},
+            {"type": "user", "content": [{"type": "tool_result", "tool_use_id": "t1"}]},
+            {"type": "system", "content": "boot"},
+            {"type": "summary", "message": "not-a-dict"},
+            {"type": ["x"], "message": {"role": ["y"], "content": "unhashable"}},
+        ]
+        for msg in messages:
+            with self.subTest(msg=msg):
+                self.assertEqual(
+                    transcript._classify(msg),
+                    (transcript.get_role(msg), transcript.get_content(msg), transcript.is_tool_result(msg)),
+                )
+
+    def test_extract_text_joins_non_empty_parts_in_order(self) -> None:
+        content = [
+            {"type": "text", "text": "a"},
+            "b",
+            {"type": "text", "text": ""},
+            {"type": "tool_use", "id": "t1"},
+            "",
+            {"type": "text", "text": "c"},
+        ]
+        self.assertEqual(transcript.extract_text(content), "a\nb\nc")
+        self.assertEqual(transcript.extract_text(None), "")
+
     def test_decode_jsonl_lines_skips_invalid_json(self) -> None:
         lines = ['{"type":"user"}', "", "not-json", '{"type":"assistant"}']
         parsed = transcript.decode_jsonl_lines(lines)
@@ -87,6 +115,17 @@ class TranscriptDomainTest(unittest.TestCase):
         self.assertEqual(meta["kept_len"], 3)
         self.assertEqual(meta["sha256"], hashlib.sha256(raw.encode("utf-8")).hexdigest())
 
+    def test_truncate_text_middle_mode_keeps_both_ends_within_budget(self) -> None:
+        raw = "HEAD-" + "x" * 1000 + "-TAIL"
+        truncated, meta = transcript.truncate_text(raw, max_chars=40, mode="middle")
+        self.assertEqual(len(truncated), 40)
+        self.assertTrue(truncated.startswith("HEAD-"))
+        self.assertTrue(truncated.endswith("-TAIL"))
+        omitted = len(raw) - meta["kept_len"]
+        self.assertIn(f"[{omitted} chars omitted]", truncated)
+        self.assertTrue(meta["truncated"])
+        self.assertEqual(meta["orig_len"], len(raw))
+
 
 if __name__ == "__main__":
     unittest.main()